@@ -1,8 +1,10 @@
 """Configuration management for the application."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -28,6 +30,7 @@ class Settings(BaseSettings):
 
     # RCON
     default_rcon_timeout: int = 10
+    max_rcon_connections: int = Field(4, ge=1)
 
     class Config:
         """Pydantic config."""
@@ -36,8 +39,13 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    The environment is parsed once; later calls return the same instance,
+    so this is safe to use as a FastAPI dependency.
+    """
     return Settings()
 
 
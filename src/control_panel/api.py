@@ -1,5 +1,6 @@
 """FastAPI routes for control panel."""
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -13,15 +14,48 @@ from src.control_panel.schemas import (
     ServerInfo,
     ServerStatus,
 )
+from src.control_panel.status import clear_status, get_status, set_status
 from src.proxy.minecraft import MinecraftClient, MinecraftError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory storage for servers (replace with database in production)
-servers: dict[str, ServerConfig] = {}
-minecraft_clients: dict[str, MinecraftClient] = {}
+# In-memory storage for servers (replace with database in production):
+# configs, clients and the static ServerInfo fields of each server.
+# The dicts are never mutated: writers build new ones and rebind the tuple
+# under the lock, so readers take a consistent snapshot without locking.
+_registry: tuple[
+    dict[str, ServerConfig], dict[str, MinecraftClient], dict[str, dict]
+] = ({}, {}, {})
+_registry_lock = asyncio.Lock()
+
+
+def get_minecraft_clients() -> dict[str, MinecraftClient]:
+    """Get a snapshot of the connected Minecraft clients.
+
+    Returns:
+        Minecraft clients keyed by server name
+    """
+    return _registry[1]
+
+
+def _info_template(config: ServerConfig) -> dict:
+    """Build the ServerInfo fields that do not change between polls."""
+    return {
+        "name": config.name,
+        "host": config.host,
+        "port": config.port,
+        "description": config.description,
+    }
+
+
+def _server_exists(name: str) -> HTTPException:
+    """Build the error for a duplicate server name."""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Server '{name}' already exists",
+    )
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -43,11 +77,10 @@ async def create_server(config: ServerConfig) -> ServerInfo:
     Raises:
         HTTPException: If server already exists or connection fails
     """
-    if config.name in servers:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Server '{config.name}' already exists",
-        )
+    global _registry
+
+    if config.name in _registry[0]:
+        raise _server_exists(config.name)
 
     try:
         # Create Minecraft client
@@ -55,56 +88,59 @@ async def create_server(config: ServerConfig) -> ServerInfo:
             host=config.host, port=config.port, password=config.password
         )
         await client.connect()
-
-        # Store configuration and client
-        servers[config.name] = config
-        minecraft_clients[config.name] = client
-
-        logger.info(f"Server '{config.name}' created and connected")
-
-        return ServerInfo(
-            name=config.name,
-            host=config.host,
-            port=config.port,
-            status=ServerStatus.ONLINE,
-            description=config.description,
-        )
     except MinecraftError as e:
-        logger.error(f"Failed to connect to server: {e}")
+        logger.error("Failed to connect to server: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to connect to Minecraft server: {e}",
         )
 
+    # Store configuration and client, unless another request added the
+    # same name while we were connecting
+    async with _registry_lock:
+        servers, clients, templates = _registry
+        duplicate = config.name in servers
+        if not duplicate:
+            _registry = (
+                {**servers, config.name: config},
+                {**clients, config.name: client},
+                {**templates, config.name: _info_template(config)},
+            )
+            set_status(config.name, ServerStatus.ONLINE)
+
+    if duplicate:
+        await client.disconnect()
+        raise _server_exists(config.name)
+
+    logger.info("Server '%s' created and connected", config.name)
+
+    return ServerInfo(
+        name=config.name,
+        host=config.host,
+        port=config.port,
+        status=ServerStatus.ONLINE,
+        description=config.description,
+    )
+
 
 @router.get("/servers", response_model=list[ServerInfo])
 async def list_servers() -> list[ServerInfo]:
     """List all configured servers.
 
+    Static fields come from per-server templates built when the server was
+    created and the rest from the status cache, so the models are built
+    without re-running validation.
+
     Returns:
         List of server info
     """
+    _, _, templates = _registry
     result = []
-    for name, config in servers.items():
-        status = ServerStatus.ONLINE
-        players = 0
-
-        try:
-            client = minecraft_clients.get(name)
-            if client:
-                players_list = await client.get_players()
-                players = len(players_list)
-        except Exception:
-            status = ServerStatus.ERROR
-
+    for name, template in templates.items():
+        server_status, players = get_status(name)
         result.append(
-            ServerInfo(
-                name=config.name,
-                host=config.host,
-                port=config.port,
-                status=status,
-                players_online=players,
-                description=config.description,
+            ServerInfo.model_construct(
+                **template, status=server_status, players_online=players
             )
         )
 
@@ -124,30 +160,17 @@ async def get_server(server_name: str) -> ServerInfo:
     Raises:
         HTTPException: If server not found
     """
-    if server_name not in servers:
+    _, _, templates = _registry
+    template = templates.get(server_name)
+    if template is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Server not found"
         )
 
-    config = servers[server_name]
-    status = ServerStatus.ONLINE
-    players = 0
-
-    try:
-        client = minecraft_clients.get(server_name)
-        if client:
-            players_list = await client.get_players()
-            players = len(players_list)
-    except Exception:
-        status = ServerStatus.ERROR
+    server_status, players = get_status(server_name)
 
-    return ServerInfo(
-        name=config.name,
-        host=config.host,
-        port=config.port,
-        status=status,
-        players_online=players,
-        description=config.description,
+    return ServerInfo.model_construct(
+        **template, status=server_status, players_online=players
     )
 
 
@@ -161,19 +184,28 @@ async def delete_server(server_name: str) -> None:
     Raises:
         HTTPException: If server not found
     """
-    if server_name not in servers:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Server not found"
+    global _registry
+
+    async with _registry_lock:
+        servers, clients, templates = _registry
+        if server_name not in servers:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Server not found"
+            )
+
+        client = clients.get(server_name)
+        _registry = (
+            {k: v for k, v in servers.items() if k != server_name},
+            {k: v for k, v in clients.items() if k != server_name},
+            {k: v for k, v in templates.items() if k != server_name},
         )
+        clear_status(server_name)
 
     # Disconnect client
-    client = minecraft_clients.get(server_name)
     if client:
         await client.disconnect()
-        del minecraft_clients[server_name]
 
-    del servers[server_name]
-    logger.info(f"Server '{server_name}' deleted")
+    logger.info("Server '%s' deleted", server_name)
 
 
 @router.post("/servers/{server_name}/command")
@@ -190,13 +222,14 @@ async def send_command(server_name: str, command: str) -> dict[str, str]:
     Raises:
         HTTPException: If server not found or command fails
     """
-    if server_name not in servers:
+    _, clients, _ = _registry
+    client = clients.get(server_name)
+    if client is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Server not found"
         )
 
     try:
-        client = minecraft_clients[server_name]
         response = await client.send_command(command)
         return {"response": response}
     except MinecraftError as e:
@@ -0,0 +1,131 @@
+"""In-memory server status cache refreshed by a background poller."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from src.control_panel.schemas import ServerStatus
+from src.proxy.minecraft import MinecraftClient
+
+logger = logging.getLogger(__name__)
+
+# Seconds between RCON polls of every configured server
+POLL_INTERVAL = 5.0
+
+# Entries older than this are reported as errors (the poller has stalled
+# or the server failed to answer several polls in a row)
+STATUS_TTL = 3 * POLL_INTERVAL
+
+# Seconds one server may take to answer a poll. A full poll cycle then stays
+# under POLL_TIMEOUT + POLL_INTERVAL, which keeps a single slow server from
+# aging every other server's entry past the TTL
+POLL_TIMEOUT = POLL_INTERVAL
+
+# Latest known status per server: name -> (timestamp, status, players_online)
+server_status_cache: dict[str, tuple[float, ServerStatus, int]] = {}
+
+
+def set_status(server_name: str, status: ServerStatus, players_online: int = 0) -> None:
+    """Record the current status of a server.
+
+    Args:
+        server_name: Server name
+        status: Server status
+        players_online: Number of online players
+    """
+    server_status_cache[server_name] = (time.monotonic(), status, players_online)
+
+
+def get_status(server_name: str) -> tuple[ServerStatus, int]:
+    """Get the cached status of a server.
+
+    Args:
+        server_name: Server name
+
+    Returns:
+        Tuple of (status, players_online); ERROR if missing or stale
+    """
+    entry = server_status_cache.get(server_name)
+    if entry is None:
+        return ServerStatus.ERROR, 0
+
+    timestamp, status, players_online = entry
+    if time.monotonic() - timestamp > STATUS_TTL:
+        return ServerStatus.ERROR, 0
+    return status, players_online
+
+
+def clear_status(server_name: str) -> None:
+    """Remove a server from the status cache.
+
+    Args:
+        server_name: Server name
+    """
+    server_status_cache.pop(server_name, None)
+
+
+def _update(server_name: str, status: ServerStatus, players_online: int = 0) -> dict:
+    """Record a polled status and report which fields changed.
+
+    Changes are measured against get_status, which is what the HTTP API and
+    new websocket subscribers are shown, so a missing or stale entry counts
+    as ERROR with no players.
+
+    Args:
+        server_name: Server name
+        status: Server status
+        players_online: Number of online players
+
+    Returns:
+        Changed fields keyed like ServerInfo; empty if nothing changed
+    """
+    previous_status, previous_players = get_status(server_name)
+    set_status(server_name, status, players_online)
+
+    changed: dict = {}
+    if previous_status != status:
+        changed["status"] = status.value
+    if previous_players != players_online:
+        changed["players_online"] = players_online
+    return changed
+
+
+async def refresh_status(
+    get_clients: Callable[[], dict[str, MinecraftClient]],
+) -> dict[str, dict]:
+    """Poll every server once and update the cache.
+
+    Each server gets POLL_TIMEOUT seconds to answer and is marked ERROR
+    if it does not. Results for servers removed or replaced while the poll
+    was running are discarded, so deleted servers do not reappear in the
+    cache.
+
+    Args:
+        get_clients: Returns the current Minecraft clients keyed by server name
+
+    Returns:
+        Changed fields of each server whose status or player count changed
+    """
+    snapshot = list(get_clients().items())
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(client.get_players(), timeout=POLL_TIMEOUT)
+            for _, client in snapshot
+        ),
+        return_exceptions=True,
+    )
+
+    live = get_clients()
+    changes = {}
+    for (name, client), result in zip(snapshot, results):
+        if live.get(name) is not client:
+            continue
+        if isinstance(result, BaseException):
+            logger.warning("Error getting status for server '%s': %s", name, result)
+            changed = _update(name, ServerStatus.ERROR)
+        else:
+            changed = _update(name, ServerStatus.ONLINE, len(result))
+        if changed:
+            changes[name] = changed
+    return changes
@@ -2,19 +2,31 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
+from src.control_panel.status import POLL_INTERVAL, get_status, refresh_status
+from src.proxy.minecraft import MinecraftClient
+
 logger = logging.getLogger(__name__)
 
+# Seconds a client may take to accept a broadcast before it is dropped
+SEND_TIMEOUT = 5.0
+
 
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections and their per-server subscriptions."""
+
+    __slots__ = ("active_connections", "subscriptions")
 
     def __init__(self) -> None:
         """Initialize connection manager."""
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: dict[int, WebSocket] = {}
+        # Server name -> ids of the websockets following it
+        self.subscriptions: dict[str, set[int]] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a new WebSocket connection.
@@ -23,8 +35,17 @@ class ConnectionManager:
             websocket: WebSocket connection
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Active: {len(self.active_connections)}")
+        self.active_connections[id(websocket)] = websocket
+        logger.info("WebSocket connected. Active: %d", len(self.active_connections))
+
+    def subscribe(self, websocket: WebSocket, server_name: str) -> None:
+        """Subscribe a WebSocket to updates for one server.
+
+        Args:
+            websocket: WebSocket connection
+            server_name: Server to follow
+        """
+        self.subscriptions.setdefault(server_name, set()).add(id(websocket))
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Disconnect a WebSocket.
@@ -32,26 +53,58 @@ class ConnectionManager:
         Args:
             websocket: WebSocket connection
         """
-        self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Active: {len(self.active_connections)}")
+        self._remove(id(websocket))
+        logger.info("WebSocket disconnected. Active: %d", len(self.active_connections))
+
+    def _remove(self, key: int) -> None:
+        """Forget a connection and all of its subscriptions."""
+        self.active_connections.pop(key, None)
+        for server_name in list(self.subscriptions):
+            subscribers = self.subscriptions[server_name]
+            subscribers.discard(key)
+            if not subscribers:
+                del self.subscriptions[server_name]
 
-    async def broadcast(self, message: dict) -> None:
-        """Broadcast a message to all connected clients.
+    async def broadcast(self, message: dict, server_name: Optional[str] = None) -> None:
+        """Broadcast a message to connected clients.
+
+        The message is encoded once and the sends are issued concurrently,
+        so one slow client does not delay the rest. Clients that do not
+        accept the message within SEND_TIMEOUT are dropped.
 
         Args:
             message: Message to broadcast
+            server_name: Only send to subscribers of this server if given
         """
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending message: {e}")
-                disconnected.append(connection)
+        if server_name is None:
+            connections = list(self.active_connections.items())
+        else:
+            connections = [
+                (key, self.active_connections[key])
+                for key in self.subscriptions.get(server_name, ())
+                if key in self.active_connections
+            ]
+        if not connections:
+            return
+
+        payload = orjson.dumps(message).decode()
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_text(payload), timeout=SEND_TIMEOUT)
+                for _, connection in connections
+            ),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        disconnected = 0
+        for (key, _), result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.error("Error sending message: %s", result)
+                self._remove(key)
+                disconnected += 1
+        if disconnected:
+            logger.info("WebSocket disconnected. Active: %d", len(self.active_connections))
 
     async def send_personal(self, websocket: WebSocket, message: dict) -> None:
         """Send a message to a specific client.
@@ -63,43 +116,78 @@ class ConnectionManager:
         try:
             await websocket.send_json(message)
         except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            logger.error("Error sending personal message: %s", e)
 
 
 # Global connection manager
 manager = ConnectionManager()
 
 
-async def handle_server_status_updates(
-    websocket: WebSocket, server_name: str, client
+def server_status_message(server_name: str) -> dict:
+    """Build a status update message from the cache.
+
+    Args:
+        server_name: Server name
+
+    Returns:
+        Status update message
+    """
+    server_status, players = get_status(server_name)
+    return {
+        "type": "server_status",
+        "server": server_name,
+        "players_online": players,
+        "status": server_status.value,
+    }
+
+
+async def poll_server_status(
+    get_clients: Callable[[], dict[str, MinecraftClient]],
+    interval: float = POLL_INTERVAL,
 ) -> None:
+    """Refresh the status cache and broadcast changes to subscribers.
+
+    This is the only place servers are polled, so RCON load is one call per
+    server per interval regardless of how many websockets are connected.
+    Only servers whose status or player count changed are broadcast, each
+    to its own subscribers, and each update carries just the changed fields.
+
+    Args:
+        get_clients: Returns the current Minecraft clients keyed by server name
+        interval: Seconds between polls
+    """
+    while True:
+        changes = await refresh_status(get_clients)
+        if changes and manager.subscriptions:
+            await asyncio.gather(
+                *(
+                    manager.broadcast(
+                        {"type": "server_status", "server": name, **changed}, name
+                    )
+                    for name, changed in changes.items()
+                )
+            )
+        await asyncio.sleep(interval)
+
+
+async def handle_server_status_updates(websocket: WebSocket, server_name: str) -> None:
     """Handle real-time server status updates.
 
+    Sends the cached status of the requested server, then keeps the
+    websocket subscribed to that server's updates from poll_server_status
+    until the client disconnects.
+
     Args:
         websocket: WebSocket connection
         server_name: Server to monitor
-        client: Minecraft client instance
     """
+    await manager.connect(websocket)
+    manager.subscribe(websocket, server_name)
     try:
+        await manager.send_personal(websocket, server_status_message(server_name))
         while True:
-            try:
-                players = await client.get_players()
-                await manager.send_personal(
-                    websocket,
-                    {
-                        "type": "server_status",
-                        "server": server_name,
-                        "players_online": len(players),
-                        "status": "online",
-                    },
-                )
-                await asyncio.sleep(5)  # Update every 5 seconds
-            except Exception as e:
-                logger.warning(f"Error getting server status: {e}")
-                await manager.send_personal(
-                    websocket,
-                    {"type": "server_status", "server": server_name, "status": "error"},
-                )
-                await asyncio.sleep(10)
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for server {server_name}")
+        logger.info("WebSocket disconnected for server %s", server_name)
+    finally:
+        manager.disconnect(websocket)
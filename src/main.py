@@ -1,21 +1,47 @@
 """Main entry point for the application."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from src.config import setup_logging, settings
+from src.control_panel.api import get_minecraft_clients
 from src.control_panel.api import router as control_panel_router
+from src.control_panel.websocket import poll_server_status
 
 # Setup logging
 setup_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the status poller for the lifetime of the application."""
+    logger.info("Starting Minecraft Proxy Control Panel in %s mode", settings.app_env)
+    logger.info("API listening on %s:%s", settings.app_host, settings.app_port)
+    logger.info("Proxy listening on %s:%s", settings.proxy_host, settings.proxy_port)
+    status_poller = asyncio.create_task(poll_server_status(get_minecraft_clients))
+
+    yield
+
+    logger.info("Shutting down Minecraft Proxy Control Panel")
+    status_poller.cancel()
+    await asyncio.gather(status_poller, return_exceptions=True)
+    await asyncio.gather(
+        *(client.disconnect() for client in get_minecraft_clients().values()),
+        return_exceptions=True,
+    )
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Minecraft Multi-Client Proxy Control Panel",
     description="Manage multiple Minecraft servers through a unified proxy",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Include routers
@@ -28,22 +54,6 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Run on application startup."""
-    logger.info(
-        f"Starting Minecraft Proxy Control Panel in {settings.app_env} mode"
-    )
-    logger.info(f"API listening on {settings.app_host}:{settings.app_port}")
-    logger.info(f"Proxy listening on {settings.proxy_host}:{settings.proxy_port}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Run on application shutdown."""
-    logger.info("Shutting down Minecraft Proxy Control Panel")
-
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -7,6 +7,9 @@ from src.proxy.minecraft import MinecraftClient
 
 logger = logging.getLogger(__name__)
 
+# Largest packet length the Minecraft protocol allows (3-byte VarInt)
+MAX_PACKET_LENGTH = 2097151
+
 
 class ProxyConnectionError(Exception):
     """Exception for proxy connection errors."""
@@ -14,6 +17,46 @@ class ProxyConnectionError(Exception):
     pass
 
 
+async def _read_varint(reader: asyncio.StreamReader) -> int:
+    """Read a protocol VarInt.
+
+    Args:
+        reader: Stream reader for client
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ProxyConnectionError: If the VarInt is longer than 5 bytes
+    """
+    value = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value
+    raise ProxyConnectionError("VarInt is too big")
+
+
+async def read_packet(reader: asyncio.StreamReader) -> bytes:
+    """Read one length-prefixed Minecraft packet.
+
+    Args:
+        reader: Stream reader for client
+
+    Returns:
+        Packet body (packet id and data) without the length prefix
+
+    Raises:
+        ProxyConnectionError: If the length prefix is invalid
+        asyncio.IncompleteReadError: If the client closes mid-packet
+    """
+    length = await _read_varint(reader)
+    if length > MAX_PACKET_LENGTH:
+        raise ProxyConnectionError(f"Packet too large: {length} bytes")
+    return await reader.readexactly(length)
+
+
 async def handle_client(
     reader: asyncio.StreamReader, writer: asyncio.StreamWriter
 ) -> None:
@@ -30,17 +73,12 @@ async def handle_client(
         writer: Stream writer for client
     """
     peer_name = writer.get_extra_info("peername")
-    logger.debug(f"Handling client connection from {peer_name}")
+    logger.debug("Handling client connection from %s", peer_name)
 
     try:
-        # Read client data
-        data = await asyncio.wait_for(reader.read(1024), timeout=5.0)
-
-        if not data:
-            logger.debug(f"Client {peer_name} closed connection")
-            return
-
-        logger.debug(f"Received {len(data)} bytes from {peer_name}")
+        # Read the first client packet (the handshake)
+        data = await asyncio.wait_for(read_packet(reader), timeout=5.0)
+        logger.debug("Received %d bytes from %s", len(data), peer_name)
 
         # Example: Forward to Minecraft server
         # In production, parse the data to determine target server
@@ -49,7 +87,9 @@ async def handle_client(
         writer.write(response)
         await writer.drain()
 
+    except asyncio.IncompleteReadError:
+        logger.debug("Client %s closed connection", peer_name)
     except asyncio.TimeoutError:
-        logger.warning(f"Client {peer_name} request timeout")
+        logger.warning("Client %s request timeout", peer_name)
     except Exception as e:
-        logger.error(f"Error handling client {peer_name}: {e}")
+        logger.error("Error handling client %s: %s", peer_name, e)
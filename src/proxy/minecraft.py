@@ -2,12 +2,26 @@
 
 import asyncio
 import logging
+import re
+import struct
 from typing import Optional
 
-from mcrcon import MCRcon
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# RCON packet types
+PACKET_RESPONSE = 0
+PACKET_COMMAND = 2
+PACKET_LOGIN = 3
+
+# Request id the server answers with when authentication fails
+AUTH_FAILED_ID = -1
+
+# Player names in the "list" response:
+# "There are X of max Y players online: player1, player2, ..."
+PLAYER_LIST_RE = re.compile(r"players online:\s*(.*)$", re.DOTALL)
+
 
 class MinecraftError(Exception):
     """Base exception for Minecraft-related errors."""
@@ -15,11 +29,183 @@ class MinecraftError(Exception):
     pass
 
 
+def encode_packet(request_id: int, packet_type: int, payload: str) -> bytes:
+    """Encode an RCON packet.
+
+    Args:
+        request_id: Client-chosen request id echoed back by the server
+        packet_type: RCON packet type
+        payload: Packet body
+
+    Returns:
+        Packet bytes including the length prefix
+    """
+    body = payload.encode("utf-8")
+    return struct.pack("<iii", 10 + len(body), request_id, packet_type) + body + b"\x00\x00"
+
+
+async def read_packet(reader: asyncio.StreamReader) -> tuple[int, int, str]:
+    """Read a single RCON packet.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Tuple of (request_id, packet_type, payload)
+
+    Raises:
+        MinecraftError: If the packet is malformed
+    """
+    (length,) = struct.unpack("<i", await reader.readexactly(4))
+    if length < 10:
+        raise MinecraftError(f"Invalid packet length: {length}")
+
+    data = await reader.readexactly(length)
+    request_id, packet_type = struct.unpack("<ii", data[:8])
+    if data[-2:] != b"\x00\x00":
+        raise MinecraftError("Incorrect packet padding")
+    return request_id, packet_type, data[8:-2].decode("utf-8")
+
+
+class RconConnection:
+    """A single authenticated RCON socket.
+
+    Not safe for concurrent use; MinecraftClient hands each connection to
+    one request at a time.
+    """
+
+    __slots__ = ("host", "port", "password", "timeout", "reader", "writer", "_request_id")
+
+    def __init__(self, host: str, port: int, password: str, timeout: int) -> None:
+        """Initialize RCON connection.
+
+        Args:
+            host: Server hostname/IP
+            port: RCON port
+            password: RCON password
+            timeout: Connection and request timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._request_id = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the socket is open."""
+        return self.writer is not None
+
+    async def open(self) -> None:
+        """Open the socket and authenticate.
+
+        Raises:
+            MinecraftError: If authentication fails
+        """
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout=self.timeout
+        )
+        await self.request(PACKET_LOGIN, self.password)
+
+    async def close(self) -> None:
+        """Close the socket."""
+        if self.writer:
+            writer = self.writer
+            self.reader = self.writer = None
+            writer.close()
+            await writer.wait_closed()
+
+    async def request(self, packet_type: int, payload: str) -> str:
+        """Send a packet and wait for its response.
+
+        The socket is closed on any failure since an unread reply would
+        desync later requests.
+
+        Args:
+            packet_type: RCON packet type
+            payload: Packet body
+
+        Returns:
+            Response payload
+
+        Raises:
+            MinecraftError: If not connected or authentication fails
+        """
+        if not self.reader or not self.writer:
+            raise MinecraftError("Not connected to server")
+
+        request_id = self._next_id()
+        sentinel_id = None
+        try:
+            self.writer.write(encode_packet(request_id, packet_type, payload))
+            if packet_type == PACKET_COMMAND:
+                # Long replies arrive split over several packets; the server
+                # answers this follow-up packet only after the last of them
+                sentinel_id = self._next_id()
+                self.writer.write(encode_packet(sentinel_id, PACKET_RESPONSE, ""))
+            await self.writer.drain()
+            return await asyncio.wait_for(
+                self._read_reply(self.reader, request_id, sentinel_id), timeout=self.timeout
+            )
+        except BaseException:
+            await self.close()
+            raise
+
+    def _next_id(self) -> int:
+        """Get the next request id, staying within a positive int32."""
+        self._request_id = self._request_id % 0x7FFFFFFF + 1
+        return self._request_id
+
+    async def _read_reply(
+        self, reader: asyncio.StreamReader, request_id: int, sentinel_id: Optional[int]
+    ) -> str:
+        """Read the reply to a request.
+
+        Args:
+            reader: Stream to read from
+            request_id: Id of the request
+            sentinel_id: Id of the follow-up packet ending a command reply,
+                or None if the reply is a single packet
+
+        Returns:
+            Reply payload, joined across packets
+
+        Raises:
+            MinecraftError: If authentication fails
+        """
+        parts = []
+        while True:
+            response_id, _, data = await read_packet(reader)
+            if response_id == AUTH_FAILED_ID:
+                raise MinecraftError("Authentication failed")
+            if response_id == sentinel_id:
+                return "".join(parts)
+            if response_id != request_id:
+                logger.debug("Discarding RCON packet with unexpected id %d", response_id)
+                continue
+            if sentinel_id is None:
+                return data
+            parts.append(data)
+
+
 class MinecraftClient:
-    """Client for interacting with Minecraft servers via RCON."""
+    """Client for interacting with Minecraft servers via RCON.
+
+    Holds a pool of RCON connections so independent commands to the same
+    server run in parallel.
+    """
+
+    __slots__ = ("host", "port", "password", "timeout", "pool_size", "pool", "connections")
 
     def __init__(
-        self, host: str, port: int = 25575, password: str = "", timeout: int = 10
+        self,
+        host: str,
+        port: int = 25575,
+        password: str = "",
+        timeout: int = 10,
+        pool_size: int = settings.max_rcon_connections,
     ) -> None:
         """Initialize Minecraft client.
 
@@ -28,38 +214,56 @@ class MinecraftClient:
             port: RCON port (default: 25575)
             password: RCON password
             timeout: Connection timeout in seconds
+            pool_size: Number of RCON connections to keep open
         """
         self.host = host
         self.port = port
         self.password = password
         self.timeout = timeout
-        self.rcon: Optional[MCRcon] = None
+        self.pool_size = pool_size
+        self.pool: Optional[asyncio.LifoQueue[RconConnection]] = None
+        self.connections: list[RconConnection] = []
 
     async def connect(self) -> None:
-        """Connect to Minecraft server via RCON."""
-        try:
-            loop = asyncio.get_event_loop()
-            self.rcon = await loop.run_in_executor(
-                None, MCRcon, self.host, self.port, self.password, self.timeout
-            )
-            logger.info(f"Connected to Minecraft server at {self.host}:{self.port}")
-        except Exception as e:
-            logger.error(f"Failed to connect to Minecraft server: {e}")
-            raise MinecraftError(f"Connection failed: {e}")
+        """Open and authenticate all pooled RCON connections."""
+        connections = [
+            RconConnection(self.host, self.port, self.password, self.timeout)
+            for _ in range(self.pool_size)
+        ]
+        results = await asyncio.gather(
+            *(conn.open() for conn in connections), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await asyncio.gather(*(conn.close() for conn in connections))
+            logger.error("Failed to connect to Minecraft server: %s", errors[0])
+            raise MinecraftError(f"Connection failed: {errors[0]}")
+
+        # LIFO keeps the most recently used sockets in rotation
+        pool: asyncio.LifoQueue[RconConnection] = asyncio.LifoQueue()
+        for conn in connections:
+            pool.put_nowait(conn)
+        self.pool = pool
+        self.connections = connections
+        logger.info("Connected to Minecraft server at %s:%s", self.host, self.port)
 
     async def disconnect(self) -> None:
         """Disconnect from Minecraft server."""
-        if self.rcon:
+        if self.pool:
+            connections = self.connections
+            self.pool = None
+            self.connections = []
             try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self.rcon.close)
-                logger.info(f"Disconnected from Minecraft server at {self.host}")
+                await asyncio.gather(*(conn.close() for conn in connections))
+                logger.info("Disconnected from Minecraft server at %s", self.host)
             except Exception as e:
-                logger.error(f"Error disconnecting: {e}")
+                logger.error("Error disconnecting: %s", e)
 
     async def send_command(self, command: str) -> str:
         """Send a command to the Minecraft server.
 
+        Sockets that failed on a previous command are reopened before use.
+
         Args:
             command: The command to send
 
@@ -69,35 +273,50 @@ class MinecraftClient:
         Raises:
             MinecraftError: If not connected or command fails
         """
-        if not self.rcon:
+        pool = self.pool
+        if not pool:
+            raise MinecraftError("Not connected to server")
+
+        try:
+            conn = await asyncio.wait_for(pool.get(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise MinecraftError("Command failed: no free RCON connection")
+        if pool is not self.pool:
+            # Disconnected while waiting; pass the connection on so the next
+            # waiter on the old pool wakes up too
+            pool.put_nowait(conn)
             raise MinecraftError("Not connected to server")
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, self.rcon.command, command)
-            logger.debug(f"Command executed: {command}")
+            if not conn.connected:
+                await conn.open()
+            response = await conn.request(PACKET_COMMAND, command)
+            logger.debug("Command executed: %s", command)
             return response
         except Exception as e:
-            logger.error(f"Command execution failed: {e}")
+            logger.error("Command execution failed: %s", e)
             raise MinecraftError(f"Command failed: {e}")
+        finally:
+            # Always return the connection, even to a pool that was discarded
+            # by disconnect(), so no waiter on it is left blocked
+            pool.put_nowait(conn)
+            if pool is not self.pool:
+                await conn.close()
 
     async def get_players(self) -> list[str]:
         """Get list of online players.
 
         Returns:
             List of player names
+
+        Raises:
+            MinecraftError: If not connected or the command fails
         """
-        try:
-            response = await self.send_command("list")
-            # Parse player list from response
-            # Format: "There are X of max Y players online: player1, player2, ..."
-            if "players online:" in response:
-                players_part = response.split("players online:")[-1].strip()
-                return [p.strip() for p in players_part.split(",") if p.strip()]
-            return []
-        except MinecraftError as e:
-            logger.warning(f"Failed to get player list: {e}")
+        response = await self.send_command("list")
+        match = PLAYER_LIST_RE.search(response)
+        if not match:
             return []
+        return [p for p in map(str.strip, match.group(1).split(",")) if p]
 
     async def say(self, message: str) -> str:
         """Broadcast a message to all players.
@@ -12,6 +12,16 @@ logger = logging.getLogger(__name__)
 class ProxyServer:
     """TCP proxy server for Minecraft connections."""
 
+    __slots__ = (
+        "host",
+        "port",
+        "max_connections",
+        "server",
+        "active_connections",
+        "client_handler",
+        "_slots",
+    )
+
     def __init__(
         self,
         host: str = settings.proxy_host,
@@ -30,6 +40,7 @@ class ProxyServer:
         self.max_connections = max_connections
         self.server: Optional[asyncio.Server] = None
         self.active_connections = 0
+        self._slots = asyncio.Semaphore(max_connections)
         self.client_handler: Optional[Callable] = None
 
     def set_client_handler(self, handler: Callable) -> None:
@@ -47,10 +58,10 @@ class ProxyServer:
                 self._handle_connection, self.host, self.port
             )
             async with self.server:
-                logger.info(f"Proxy server started on {self.host}:{self.port}")
+                logger.info("Proxy server started on %s:%s", self.host, self.port)
                 await self.server.serve_forever()
         except Exception as e:
-            logger.error(f"Failed to start proxy server: {e}")
+            logger.error("Failed to start proxy server: %s", e)
             raise
 
     async def _handle_connection(
@@ -62,26 +73,30 @@ class ProxyServer:
             reader: Stream reader for client
             writer: Stream writer for client
         """
-        if self.active_connections >= self.max_connections:
+        # acquire() completes without yielding while a slot is free, so the
+        # check and the reservation cannot interleave with another handler
+        if self._slots.locked():
             logger.warning("Max connections reached, rejecting new connection")
             writer.close()
             await writer.wait_closed()
             return
 
+        await self._slots.acquire()
         self.active_connections += 1
         peer_name = writer.get_extra_info("peername")
-        logger.info(f"Client connected: {peer_name}")
+        logger.info("Client connected: %s", peer_name)
 
         try:
             if self.client_handler:
                 await self.client_handler(reader, writer)
         except Exception as e:
-            logger.error(f"Error handling client {peer_name}: {e}")
+            logger.error("Error handling client %s: %s", peer_name, e)
         finally:
+            self.active_connections -= 1
+            self._slots.release()
             writer.close()
             await writer.wait_closed()
-            self.active_connections -= 1
-            logger.info(f"Client disconnected: {peer_name}")
+            logger.info("Client disconnected: %s", peer_name)
 
     async def stop(self) -> None:
         """Stop the proxy server."""
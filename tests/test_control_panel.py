@@ -1,9 +1,26 @@
 """Tests for the control panel API."""
 
+import asyncio
+import json
+
 import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
+from src.config import Settings, get_settings
+from src.control_panel import api
+from src.control_panel import status as status_cache
+from src.control_panel import websocket as websocket_module
+from src.control_panel.schemas import ServerConfig, ServerStatus
+from src.control_panel.websocket import (
+    ConnectionManager,
+    handle_server_status_updates,
+    manager,
+    poll_server_status,
+)
 from src.main import app
+from src.proxy.minecraft import MinecraftClient, MinecraftError
 
 client = TestClient(app)
 
@@ -28,6 +45,39 @@ class TestControlPanelAPI:
         assert isinstance(data, list)
         assert len(data) == 0
 
+    def test_list_and_get_cached_server(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that server info is served from the status cache."""
+        config = ServerConfig(name="cached", host="mc.local", password="x", description="d")
+        template = api._info_template(config)
+        monkeypatch.setattr(api, "_registry", ({"cached": config}, {}, {"cached": template}))
+        status_cache.set_status("cached", ServerStatus.ONLINE, 3)
+        try:
+            expected = {
+                "name": "cached",
+                "host": "mc.local",
+                "port": 25575,
+                "status": "online",
+                "players_online": 3,
+                "max_players": 20,
+                "description": "d",
+            }
+            assert client.get("/api/servers").json() == [expected]
+            assert client.get("/api/servers/cached").json() == expected
+        finally:
+            status_cache.clear_status("cached")
+
+    def test_delete_server_replaces_registry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that deleting a server leaves earlier snapshots untouched."""
+        config = ServerConfig(name="gone", host="mc.local", password="x")
+        snapshot = ({"gone": config}, {}, {"gone": api._info_template(config)})
+        monkeypatch.setattr(api, "_registry", snapshot)
+
+        response = client.delete("/api/servers/gone")
+
+        assert response.status_code == 204
+        assert api._registry == ({}, {}, {})
+        assert snapshot[0] == {"gone": config}
+
     def test_get_nonexistent_server(self) -> None:
         """Test getting a server that doesn't exist."""
         response = client.get("/api/servers/nonexistent")
@@ -66,3 +116,264 @@ class TestControlPanelAPI:
         """Test sending command to nonexistent server."""
         response = client.post("/api/servers/nonexistent/command", params={"command": "list"})
         assert response.status_code == 404
+
+    def test_lifespan_startup_and_shutdown(self) -> None:
+        """Test that the app starts and stops its background poller cleanly."""
+        with TestClient(app) as lifespan_client:
+            assert lifespan_client.get("/health").json() == {"status": "healthy"}
+
+    def test_settings_cached(self) -> None:
+        """Test that settings are parsed once and reused."""
+        assert get_settings() is get_settings()
+
+    def test_rcon_pool_size_must_be_positive(self) -> None:
+        """Test that an empty RCON pool is rejected at configuration time."""
+        with pytest.raises(ValidationError):
+            Settings(max_rcon_connections=0)
+
+
+class FakeClient:
+    """Minecraft client stub returning a fixed player list."""
+
+    def __init__(self, players: list[str], fail: bool = False) -> None:
+        """Initialize fake client."""
+        self.players = players
+        self.fail = fail
+        self.calls = 0
+
+    async def get_players(self) -> list[str]:
+        """Return the configured players."""
+        self.calls += 1
+        if self.fail:
+            raise MinecraftError("Command failed: RCON unavailable")
+        return self.players
+
+
+@pytest.mark.unit
+class TestStatusCache:
+    """Tests for the server status cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        """Reset the status cache between tests."""
+        status_cache.server_status_cache.clear()
+
+    def test_missing_server_is_error(self) -> None:
+        """Test that unknown servers report an error status."""
+        assert status_cache.get_status("missing") == (ServerStatus.ERROR, 0)
+
+    def test_stale_entry_is_error(self) -> None:
+        """Test that entries older than the TTL report an error status."""
+        status_cache.server_status_cache["old"] = (
+            -status_cache.STATUS_TTL * 2,
+            ServerStatus.ONLINE,
+            3,
+        )
+        assert status_cache.get_status("old") == (ServerStatus.ERROR, 0)
+
+    async def test_refresh_status(self) -> None:
+        """Test that a refresh polls each server once and caches the result."""
+        clients = {"a": FakeClient(["alice", "bob"]), "b": FakeClient([], fail=True)}
+
+        await status_cache.refresh_status(lambda: clients)
+
+        assert status_cache.get_status("a") == (ServerStatus.ONLINE, 2)
+        assert status_cache.get_status("b") == (ServerStatus.ERROR, 0)
+        assert all(c.calls == 1 for c in clients.values())
+
+    async def test_refresh_status_unreachable_server(self) -> None:
+        """Test that a real client that cannot run commands is cached as ERROR."""
+        clients = {"down": MinecraftClient(host="127.0.0.1", port=1, password="x")}
+
+        await status_cache.refresh_status(lambda: clients)
+
+        assert status_cache.get_status("down") == (ServerStatus.ERROR, 0)
+
+    async def test_refresh_status_bounds_slow_server(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a hung server is marked ERROR without holding up the rest."""
+
+        class HungClient(FakeClient):
+            async def get_players(self) -> list[str]:
+                await asyncio.Event().wait()
+                return []
+
+        monkeypatch.setattr(status_cache, "POLL_TIMEOUT", 0.01)
+        clients = {"fast": FakeClient(["alice"]), "hung": HungClient([])}
+
+        await asyncio.wait_for(status_cache.refresh_status(lambda: clients), timeout=1)
+
+        assert status_cache.get_status("fast") == (ServerStatus.ONLINE, 1)
+        assert status_cache.get_status("hung") == (ServerStatus.ERROR, 0)
+
+    async def test_refresh_status_skips_deleted_server(self) -> None:
+        """Test that a server deleted mid-poll is not written back to the cache."""
+        registry = {"a": FakeClient(["alice"])}
+
+        class DeletedDuringPoll(FakeClient):
+            async def get_players(self) -> list[str]:
+                registry.pop("gone")
+                return []
+
+        registry["gone"] = DeletedDuringPoll([])
+
+        changes = await status_cache.refresh_status(lambda: registry)
+
+        assert list(changes) == ["a"]
+        assert "gone" not in status_cache.server_status_cache
+
+    async def test_refresh_status_recovers_stale_entry(self) -> None:
+        """Test that a poll matching a stale entry still reports it back online."""
+        status_cache.server_status_cache["a"] = (
+            -status_cache.STATUS_TTL * 2,
+            ServerStatus.ONLINE,
+            1,
+        )
+        clients = {"a": FakeClient(["alice"])}
+
+        changes = await status_cache.refresh_status(lambda: clients)
+
+        assert changes == {"a": {"status": "online", "players_online": 1}}
+
+    async def test_refresh_status_reports_changes(self) -> None:
+        """Test that a refresh reports only the fields that changed."""
+        fake = FakeClient(["alice"])
+        clients = {"a": fake}
+
+        first = await status_cache.refresh_status(lambda: clients)
+        assert first == {"a": {"status": "online", "players_online": 1}}
+        assert await status_cache.refresh_status(lambda: clients) == {}
+
+        fake.players = ["alice", "bob"]
+        assert await status_cache.refresh_status(lambda: clients) == {"a": {"players_online": 2}}
+
+
+class FakeWebSocket:
+    """WebSocket stub recording sent messages."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize fake websocket."""
+        self.fail = fail
+        self.sent: list = []
+        self.closed = asyncio.Event()
+
+    async def receive_text(self) -> str:
+        """Block until the client disconnects."""
+        await self.closed.wait()
+        raise WebSocketDisconnect()
+
+    async def accept(self) -> None:
+        """Accept the connection."""
+
+    async def send_json(self, message: dict) -> None:
+        """Record a message or fail like a closed socket."""
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(message)
+
+    async def send_text(self, data: str) -> None:
+        """Record a JSON text frame or fail like a closed socket."""
+        await self.send_json(json.loads(data))
+
+
+@pytest.mark.unit
+class TestConnectionManager:
+    """Tests for the WebSocket connection manager."""
+
+    async def test_broadcast_drops_dead_connections(self) -> None:
+        """Test that broadcast delivers to live clients and drops failed ones."""
+        manager = ConnectionManager()
+        alive, dead = FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect(alive)
+        await manager.connect(dead)
+
+        await manager.broadcast({"type": "ping"})
+
+        assert alive.sent == [{"type": "ping"}]
+        assert list(manager.active_connections.values()) == [alive]
+
+    async def test_broadcast_drops_cancelled_send(self) -> None:
+        """Test that a send that was cancelled counts as a dead connection."""
+
+        class CancelledWebSocket(FakeWebSocket):
+            async def send_text(self, data: str) -> None:
+                raise asyncio.CancelledError()
+
+        manager = ConnectionManager()
+        await manager.connect(CancelledWebSocket())
+
+        await manager.broadcast({"type": "ping"})
+
+        assert manager.active_connections == {}
+
+    async def test_broadcast_drops_stalled_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a client that never accepts a send is dropped after the timeout."""
+
+        class StalledWebSocket(FakeWebSocket):
+            async def send_text(self, data: str) -> None:
+                await asyncio.Event().wait()
+
+        monkeypatch.setattr(websocket_module, "SEND_TIMEOUT", 0.01)
+        manager = ConnectionManager()
+        alive = FakeWebSocket()
+        await manager.connect(alive)
+        await manager.connect(StalledWebSocket())
+
+        await asyncio.wait_for(manager.broadcast({"type": "ping"}), timeout=1)
+
+        assert alive.sent == [{"type": "ping"}]
+        assert list(manager.active_connections.values()) == [alive]
+
+    async def test_broadcast_to_server_subscribers(self) -> None:
+        """Test that a server-scoped broadcast only reaches its subscribers."""
+        manager = ConnectionManager()
+        follower, other = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(follower)
+        await manager.connect(other)
+        manager.subscribe(follower, "a")
+
+        await manager.broadcast({"type": "ping"}, "a")
+
+        assert follower.sent == [{"type": "ping"}]
+        assert other.sent == []
+
+    async def test_disconnect_unknown_is_noop(self) -> None:
+        """Test that disconnecting an untracked websocket does not raise."""
+        manager = ConnectionManager()
+        manager.disconnect(FakeWebSocket())
+        assert manager.active_connections == {}
+
+    async def test_poller_broadcasts_to_subscribers(self) -> None:
+        """Test that one poll feeds each server's subscribers only."""
+        status_cache.server_status_cache.clear()
+        clients = {"a": FakeClient(["alice"]), "b": FakeClient([])}
+        followers_a = [FakeWebSocket(), FakeWebSocket()]
+        follower_b = FakeWebSocket()
+        handlers = [
+            asyncio.create_task(handle_server_status_updates(ws, "a")) for ws in followers_a
+        ]
+        handlers.append(asyncio.create_task(handle_server_status_updates(follower_b, "b")))
+        await asyncio.sleep(0)
+
+        poller = asyncio.create_task(poll_server_status(lambda: clients, interval=60))
+        await asyncio.sleep(0.01)
+        poller.cancel()
+
+        assert clients["a"].calls == 1
+        for ws in followers_a:
+            assert ws.sent[-1] == {
+                "type": "server_status",
+                "server": "a",
+                "players_online": 1,
+                "status": "online",
+            }
+            assert all(message["server"] == "a" for message in ws.sent)
+        assert follower_b.sent[-1]["server"] == "b"
+        assert all(message["server"] == "b" for message in follower_b.sent)
+
+        for ws in [*followers_a, follower_b]:
+            ws.closed.set()
+        await asyncio.gather(*handlers)
+        assert manager.active_connections == {}
+        assert manager.subscriptions == {}
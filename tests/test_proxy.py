@@ -1,8 +1,64 @@
 """Tests for the proxy module."""
 
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
 
-from src.proxy.minecraft import MinecraftClient, MinecraftError
+from src.proxy.connection import ProxyConnectionError
+from src.proxy.connection import read_packet as read_client_packet
+from src.proxy.minecraft import (
+    AUTH_FAILED_ID,
+    PACKET_COMMAND,
+    PACKET_LOGIN,
+    MinecraftClient,
+    MinecraftError,
+    encode_packet,
+    read_packet,
+)
+from src.proxy.server import ProxyServer
+
+
+@pytest.fixture
+async def rcon_server() -> AsyncIterator[int]:
+    """Run a fake RCON server accepting password 'test' and echoing commands.
+
+    Like Minecraft, it answers packets of unknown type with the same id, and
+    splits replies longer than 4096 bytes: the command "long" gets a reply
+    of 4096 bytes plus "TAIL". The command "slow" is answered after a short
+    delay.
+    """
+
+    handlers: set[asyncio.Task] = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_id, packet_type, payload = await read_packet(reader)
+                if packet_type == PACKET_LOGIN:
+                    reply_id = request_id if payload == "test" else AUTH_FAILED_ID
+                    writer.write(encode_packet(reply_id, 2, ""))
+                elif packet_type != PACKET_COMMAND:
+                    writer.write(encode_packet(request_id, 0, f"Unknown request {packet_type}"))
+                elif payload == "long":
+                    writer.write(encode_packet(request_id, 0, "x" * 4096))
+                    writer.write(encode_packet(request_id, 0, "TAIL"))
+                else:
+                    if payload == "slow":
+                        await asyncio.sleep(0.2)
+                    writer.write(encode_packet(request_id, 0, f"echo: {payload}"))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+    for task in handlers:
+        task.cancel()
+    await asyncio.gather(*handlers, return_exceptions=True)
+    await server.wait_closed()
 
 
 @pytest.mark.unit
@@ -44,6 +100,217 @@ class TestMinecraftClient:
             # Server not available, skip
             pytest.skip("Minecraft server not available")
 
+    @pytest.mark.asyncio
+    async def test_send_command_over_rcon(self, rcon_server: int) -> None:
+        """Test a login and command round-trip against a fake RCON server."""
+        client = MinecraftClient(host="127.0.0.1", port=rcon_server, password="test")
+        await client.connect()
+        try:
+            assert await client.send_command("list") == "echo: list"
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_fragmented_reply_is_joined(self, rcon_server: int) -> None:
+        """Test that a reply split over packets is read fully before the next command."""
+        client = MinecraftClient(
+            host="127.0.0.1", port=rcon_server, password="test", pool_size=1
+        )
+        await client.connect()
+        try:
+            assert await client.send_command("long") == "x" * 4096 + "TAIL"
+            assert await client.send_command("list") == "echo: list"
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_use_pool(self, rcon_server: int) -> None:
+        """Test that concurrent commands are spread over pooled connections."""
+        client = MinecraftClient(
+            host="127.0.0.1", port=rcon_server, password="test", pool_size=2
+        )
+        await client.connect()
+        try:
+            assert len(client.connections) == 2
+            responses = await asyncio.gather(
+                *(client.send_command(f"cmd{i}") for i in range(5))
+            )
+            assert responses == [f"echo: cmd{i}" for i in range(5)]
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            ("There are 2 of a max of 20 players online: alice, bob", ["alice", "bob"]),
+            ("There are 0 of a max of 20 players online: ", []),
+            ("Unknown command", []),
+        ],
+    )
+    async def test_get_players_parsing(
+        self,
+        client: MinecraftClient,
+        monkeypatch: pytest.MonkeyPatch,
+        response: str,
+        expected: list[str],
+    ) -> None:
+        """Test parsing of the RCON list response."""
+
+        async def fake_send_command(self: MinecraftClient, command: str) -> str:
+            return response
+
+        monkeypatch.setattr(MinecraftClient, "send_command", fake_send_command)
+        assert await client.get_players() == expected
+
+    @pytest.mark.asyncio
+    async def test_disconnect_wakes_waiting_commands(self, rcon_server: int) -> None:
+        """Test that commands queued for a connection fail on disconnect."""
+        client = MinecraftClient(
+            host="127.0.0.1", port=rcon_server, password="test", pool_size=1
+        )
+        await client.connect()
+        in_flight = asyncio.create_task(client.send_command("slow"))
+        waiting = asyncio.create_task(client.send_command("list"))
+        await asyncio.sleep(0.05)
+
+        await client.disconnect()
+        results = await asyncio.wait_for(
+            asyncio.gather(in_flight, waiting, return_exceptions=True), timeout=2
+        )
+
+        assert all(isinstance(r, MinecraftError) for r in results)
+        with pytest.raises(MinecraftError, match="Not connected"):
+            await waiting
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_times_out(self, rcon_server: int) -> None:
+        """Test that waiting for a busy pool fails after the client timeout."""
+        client = MinecraftClient(
+            host="127.0.0.1", port=rcon_server, password="test", pool_size=1
+        )
+        await client.connect()
+        try:
+            in_flight = asyncio.create_task(client.send_command("slow"))
+            await asyncio.sleep(0.01)
+            client.timeout = 0.05
+            with pytest.raises(MinecraftError, match="no free RCON connection"):
+                await client.send_command("list")
+            assert await in_flight == "echo: slow"
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_failed_connection_is_reopened(self, rcon_server: int) -> None:
+        """Test that a pooled connection that dropped is reopened on next use."""
+        client = MinecraftClient(
+            host="127.0.0.1", port=rcon_server, password="test", pool_size=1
+        )
+        await client.connect()
+        try:
+            await client.connections[0].close()
+            assert await client.send_command("list") == "echo: list"
+            assert client.connections[0].connected
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_wrong_password(self, rcon_server: int) -> None:
+        """Test that a rejected login raises MinecraftError."""
+        client = MinecraftClient(host="127.0.0.1", port=rcon_server, password="wrong")
+        with pytest.raises(MinecraftError, match="Authentication failed"):
+            await client.connect()
+
+
+class FakeWriter:
+    """Stream writer stub for proxy connection tests."""
+
+    def __init__(self) -> None:
+        """Initialize fake writer."""
+        self.closed = False
+
+    def get_extra_info(self, name: str) -> tuple[str, int]:
+        """Return a fake peer name."""
+        return ("127.0.0.1", 12345)
+
+    def close(self) -> None:
+        """Mark the writer closed."""
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        """Wait for close."""
+
+
+@pytest.mark.unit
+class TestProxyServer:
+    """Tests for ProxyServer connection limits."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_max_connections(self) -> None:
+        """Test that connections beyond the limit are closed unhandled."""
+        proxy = ProxyServer(host="127.0.0.1", port=0, max_connections=1)
+        release = asyncio.Event()
+        handled = []
+
+        async def handler(reader: object, writer: FakeWriter) -> None:
+            handled.append(writer)
+            await release.wait()
+
+        proxy.set_client_handler(handler)
+        first, second = FakeWriter(), FakeWriter()
+        task = asyncio.create_task(proxy._handle_connection(None, first))
+        await asyncio.sleep(0)
+
+        await proxy._handle_connection(None, second)
+        assert second.closed
+        assert handled == [first]
+        assert proxy.active_connections == 1
+
+        release.set()
+        await task
+        assert proxy.active_connections == 0
+        third = FakeWriter()
+        task = asyncio.create_task(proxy._handle_connection(None, third))
+        await asyncio.sleep(0)
+        assert handled == [first, third]
+        release.set()
+        await task
+
+
+@pytest.mark.unit
+class TestClientPackets:
+    """Tests for reading length-prefixed client packets."""
+
+    @staticmethod
+    def make_reader(data: bytes) -> asyncio.StreamReader:
+        """Create a stream reader preloaded with data."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    @pytest.mark.asyncio
+    async def test_read_packet(self) -> None:
+        """Test reading a packet with a multi-byte VarInt length."""
+        body = b"\x00" + b"x" * 299
+        reader = self.make_reader(b"\xac\x02" + body + b"next")
+        assert await read_client_packet(reader) == body
+        assert await reader.read() == b"next"
+
+    @pytest.mark.asyncio
+    async def test_read_packet_varint_too_big(self) -> None:
+        """Test that an over-long VarInt is rejected."""
+        reader = self.make_reader(b"\xff" * 6)
+        with pytest.raises(ProxyConnectionError, match="VarInt"):
+            await read_client_packet(reader)
+
+    @pytest.mark.asyncio
+    async def test_read_packet_truncated(self) -> None:
+        """Test that a packet cut short raises IncompleteReadError."""
+        reader = self.make_reader(b"\x05ab")
+        with pytest.raises(asyncio.IncompleteReadError):
+            await read_client_packet(reader)
+
 
 @pytest.mark.unit
 class TestProxyErrors: